@@ -25,7 +25,7 @@ class Settings(BaseSettings):
         description="Database connection URL",
     )
     test_database_url: str = Field(
-        default="sqlite+aiosqlite:///./test_widgets.db",
+        default="sqlite+aiosqlite:///:memory:",
         description="Test database connection URL",
     )
 
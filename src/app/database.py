@@ -3,12 +3,14 @@
 import os
 from typing import AsyncGenerator
 
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
 )
 from sqlalchemy.orm import declarative_base
+from sqlalchemy.pool import StaticPool
 
 from .config import get_settings
 
@@ -21,13 +23,30 @@ engine = create_async_engine(
     future=True,
 )
 
-# Create test engine for testing
+# Create test engine for testing. StaticPool hands every session the same
+# connection, which keeps an in-memory SQLite database alive between them.
+# SQL echo stays off so DEBUG=true does not log every test statement.
 test_engine = create_async_engine(
     settings.test_database_url,
-    echo=settings.debug,
+    echo=False,
     future=True,
+    poolclass=StaticPool,
+    connect_args={"check_same_thread": False},
 )
 
+
+@event.listens_for(test_engine.sync_engine, "connect")
+def _disable_driver_transactions(dbapi_connection, connection_record):
+    """Stop the sqlite driver from managing transactions itself."""
+    dbapi_connection.isolation_level = None
+
+
+@event.listens_for(test_engine.sync_engine, "begin")
+def _begin_transaction(conn):
+    """Emit BEGIN so SAVEPOINTs nest inside a real transaction."""
+    conn.exec_driver_sql("BEGIN")
+
+
 # Create async session factories
 AsyncSessionLocal = async_sessionmaker(
     engine,
@@ -104,6 +123,13 @@ async def drop_test_tables() -> None:
         await conn.run_sync(Base.metadata.drop_all)
 
 
+async def clear_test_tables() -> None:
+    """Delete all rows from the test database tables, keeping the schema."""
+    async with test_engine.begin() as conn:
+        for table in reversed(Base.metadata.sorted_tables):
+            await conn.execute(table.delete())
+
+
 def is_testing() -> bool:
     """Check if we're running in test mode."""
     return os.getenv("TESTING", "false").lower() == "true"
@@ -7,7 +7,7 @@ with proper error handling, pagination, and async SQLAlchemy 2.0 support.
 
 from typing import Optional, Sequence
 
-from sqlalchemy import delete, func, select, update
+from sqlalchemy import delete, exists, func, insert, select, update
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -93,13 +93,18 @@ class WidgetRepository:
             WidgetCreateError: If creation fails
         """
         try:
-            widget = Widget(
-                name=widget_data.name,
-                number_of_parts=widget_data.number_of_parts,
+            # RETURNING brings back server defaults in the INSERT itself
+            stmt = (
+                insert(Widget)
+                .values(
+                    name=widget_data.name,
+                    number_of_parts=widget_data.number_of_parts,
+                )
+                .returning(Widget)
             )
-            self.session.add(widget)
+            result = await self.session.execute(stmt)
+            widget = result.scalar_one()
             await self.session.commit()
-            await self.session.refresh(widget)
 
             logger.info(f"Created widget with ID {widget.id}")
             return widget
@@ -282,7 +287,6 @@ class WidgetRepository:
             updated_widget = result.scalar_one()
 
             await self.session.commit()
-            await self.session.refresh(updated_widget)
 
             logger.info(f"Updated widget with ID {widget_id}")
             return updated_widget
@@ -363,10 +367,9 @@ class WidgetRepository:
             True if widget exists, False otherwise
         """
         try:
-            stmt = select(func.count(Widget.id)).where(Widget.id == widget_id)
+            stmt = select(exists().where(Widget.id == widget_id))
             result = await self.session.execute(stmt)
-            count = result.scalar_one()
-            return count > 0
+            return bool(result.scalar_one())
 
         except SQLAlchemyError as e:
             logger.error(
@@ -6,14 +6,20 @@ for database setup, test client, and common test utilities.
 """
 
 import asyncio
+import copy
 import sys
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import Mock
 
+import httpx
 import pytest
+import pytest_asyncio
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
-from starlette.requests import Request
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.datastructures import URL
 from starlette.responses import Response
 
 # Add the project root to Python path to enable imports from src
@@ -22,38 +28,129 @@ sys.path.insert(0, str(project_root))
 
 # noqa: E402 - imports below must come after sys.path modification
 from src.app.database import (  # noqa: E402
+    TestAsyncSessionLocal,
+    clear_test_tables,
     create_test_tables,
     drop_test_tables,
     get_db,
     get_test_db,
+    test_engine,
 )
 from src.app.main import create_app  # noqa: E402
+from src.app.models.widget import Widget  # noqa: E402
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def test_app():
     """Create test FastAPI application with test database override."""
     app = create_app()
     # Override the database dependency to use test database
     app.dependency_overrides[get_db] = get_test_db
+    # Build the OpenAPI schema once; FastAPI caches it on app.openapi_schema
+    app.openapi()
     return app
 
 
-@pytest.fixture
-def client(test_app):
-    """Create test client for FastAPI application."""
+@pytest.fixture(scope="session")
+def session_client(test_app):
+    """Create one test client shared by the whole session."""
     return TestClient(test_app)
 
 
-@pytest.fixture(autouse=True, scope="function")
-def setup_test_db():
-    """Set up clean test database for each test function."""
-    # Clean up before each test
-    asyncio.run(drop_test_tables())
-    asyncio.run(create_test_tables())
+@pytest_asyncio.fixture
+async def db_session():
+    """Provide a session whose work is rolled back after each test."""
+    async with test_engine.connect() as conn:
+        trans = await conn.begin()
+        # Commits inside the test only release a SAVEPOINT
+        session = AsyncSession(
+            bind=conn,
+            expire_on_commit=False,
+            join_transaction_mode="create_savepoint",
+        )
+        try:
+            yield session
+        finally:
+            await session.close()
+            await trans.rollback()
+
+
+@pytest.fixture
+def widgets_factory(db_session):
+    """Provide a helper that inserts widgets with one INSERT statement."""
+
+    async def _make(rows):
+        stmt = insert(Widget).returning(Widget, sort_by_parameter_order=True)
+        result = await db_session.execute(stmt, list(rows))
+        widgets = result.scalars().all()
+        await db_session.commit()
+        return widgets
+
+    return _make
+
+
+@pytest.fixture
+def override_db(test_app, db_session):
+    """Route the app's get_db dependency to the rolled-back session."""
+
+    async def override_get_db():
+        yield db_session
+
+    test_app.dependency_overrides[get_db] = override_get_db
+    yield db_session
+    test_app.dependency_overrides[get_db] = get_test_db
+
+
+@pytest.fixture
+def client(session_client, override_db):
+    """Create test client whose requests use the rolled-back session."""
+    return session_client
+
+
+@pytest_asyncio.fixture(scope="session")
+async def session_async_client(test_app):
+    """Create one in-process async client shared by the whole session."""
+    transport = httpx.ASGITransport(app=test_app)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://test"
+    ) as async_client:
+        yield async_client
+
+
+@pytest.fixture
+def async_client(session_async_client, override_db):
+    """Create async client whose requests use the rolled-back session."""
+    return session_async_client
+
+
+@pytest.fixture(scope="session")
+def event_loop():
+    """Share a single event loop across the whole test session."""
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest_asyncio.fixture(autouse=True, scope="session")
+async def test_schema():
+    """Create the test database schema once for the whole session."""
+    await drop_test_tables()
+    await create_test_tables()
+    # Warm up: one throwaway insert compiles the INSERT statement and
+    # allocates the table and index pages before the first test runs
+    async with TestAsyncSessionLocal() as session:
+        session.add(Widget(name="warm", number_of_parts=1))
+        await session.commit()
+    await clear_test_tables()
+    yield
+    await drop_test_tables()
+
+
+@pytest_asyncio.fixture(autouse=True, scope="function")
+async def setup_test_db(test_schema):
+    """Leave the test database empty after each test function."""
     yield
-    # Clean up after each test
-    asyncio.run(drop_test_tables())
+    await clear_test_tables()
 
 
 @pytest.fixture
@@ -65,6 +162,13 @@ def sample_widget_data():
     }
 
 
+@pytest.fixture
+def created_widget(client, sample_widget_data):
+    """Create a widget through the API and return its response body."""
+    response = client.post("/widgets/", json=sample_widget_data)
+    return response.json()
+
+
 @pytest.fixture
 def multiple_widget_data():
     """Provide multiple widget data sets for testing."""
@@ -77,20 +181,22 @@ def multiple_widget_data():
     ]
 
 
+@pytest.fixture(scope="session")
+def request_template():
+    """Build the request stand-in once; tests get deep copies of it."""
+    return SimpleNamespace(
+        url=URL("http://test.com/api/widgets"),
+        method="GET",
+        state=SimpleNamespace(request_id="test-123"),
+        client=SimpleNamespace(host="127.0.0.1"),
+        headers={"content-type": "application/json"},
+    )
+
+
 @pytest.fixture
-def mock_request():
+def mock_request(request_template):
     """Create a mock request object for testing."""
-    request = Mock(spec=Request)
-    request.url = Mock()
-    request.url.__str__ = Mock(return_value="http://test.com/api/widgets")
-    request.url.path = "/api/widgets"
-    request.method = "GET"
-    request.state = Mock()
-    request.state.request_id = "test-123"
-    request.client = Mock()
-    request.client.host = "127.0.0.1"
-    request.headers = {"content-type": "application/json"}
-    return request
+    return copy.deepcopy(request_template)
 
 
 @pytest.fixture
@@ -102,7 +208,7 @@ def mock_response():
     return response
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def app_with_middleware():
     """Create a FastAPI app with middleware for testing."""
     app = FastAPI()
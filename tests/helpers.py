@@ -0,0 +1,10 @@
+"""
+Shared helpers for the test suite.
+"""
+
+import orjson
+
+
+def rjson(response):
+    """Decode a test client response body with orjson."""
+    return orjson.loads(response.content)
@@ -5,14 +5,15 @@ This module tests the exception handling system including custom exception
 handlers, error response formatting, and integration with FastAPI.
 """
 
-import json
+import re
 from unittest.mock import Mock, patch
 
+import orjson
 import pytest
 from fastapi import FastAPI, status
 from fastapi.exceptions import RequestValidationError
 from fastapi.testclient import TestClient
-from pydantic import ValidationError
+from pydantic import BaseModel, Field, ValidationError
 from starlette.exceptions import HTTPException as StarletteHTTPException
 from starlette.responses import JSONResponse
 
@@ -26,6 +27,36 @@ from src.app.exception_handlers import (
     validation_exception_handler,
 )
 from src.app.exceptions import BaseAPIException, WidgetNotFoundException
+from tests.helpers import rjson
+
+# Matches a generated UUID4 request_id in a rendered JSONResponse body
+_UUID_RE = re.compile(rb'"request_id":"[0-9a-f-]{36}"')
+
+
+class SampleModel(BaseModel):
+    """Model used to produce real Pydantic validation errors."""
+
+    name: str = Field(..., min_length=1)
+    count: int = Field(..., gt=0)
+
+
+@pytest.fixture
+def mock_log_error():
+    """Patch log_error so handler tests don't write error logs."""
+    with patch("src.app.exception_handlers.log_error") as mock_log:
+        yield mock_log
+
+
+@pytest.fixture
+def debug_on(monkeypatch):
+    """Run the test with debug mode enabled in the handlers' settings."""
+    monkeypatch.setattr("src.app.exception_handlers.settings.debug", True)
+
+
+@pytest.fixture
+def debug_off(monkeypatch):
+    """Run the test with debug mode disabled in the handlers' settings."""
+    monkeypatch.setattr("src.app.exception_handlers.settings.debug", False)
 
 
 class TestCreateErrorResponse:
@@ -45,7 +76,7 @@ class TestCreateErrorResponse:
         assert response.status_code == 400
 
         # Parse the response content
-        content = json.loads(response.body)
+        content = orjson.loads(response.body)
         assert content["error"] == "TEST_ERROR"
         assert content["message"] == "Test error message"
         assert content["request_id"] == request_id
@@ -63,14 +94,11 @@ class TestCreateErrorResponse:
             details=details,
         )
 
-        content = json.loads(response.body)
+        content = orjson.loads(response.body)
         assert content["details"] == details
 
-    @patch("src.app.exception_handlers.settings")
-    def test_error_response_debug_mode_with_stack_trace(self, mock_settings):
+    def test_error_response_debug_mode_with_stack_trace(self, debug_on):
         """Test error response includes stack trace in debug mode."""
-        mock_settings.debug = True
-
         details = {"stack_trace": "line 1\nline 2\nline 3"}
         response = create_error_response(
             request_id="test-123",
@@ -80,16 +108,11 @@ class TestCreateErrorResponse:
             details=details,
         )
 
-        content = json.loads(response.body)
+        content = orjson.loads(response.body)
         assert content["stack_trace"] == "line 1\nline 2\nline 3"
 
-    @patch("src.app.exception_handlers.settings")
-    def test_error_response_production_mode_no_stack_trace(
-        self, mock_settings
-    ):
+    def test_error_response_production_mode_no_stack_trace(self, debug_off):
         """Test error response excludes stack trace in production mode."""
-        mock_settings.debug = False
-
         details = {"stack_trace": "sensitive info"}
         response = create_error_response(
             request_id="test-123",
@@ -99,15 +122,18 @@ class TestCreateErrorResponse:
             details=details,
         )
 
-        content = json.loads(response.body)
+        content = orjson.loads(response.body)
         assert "stack_trace" not in content
 
 
+@pytest.mark.usefixtures("mock_log_error")
 class TestBaseAPIExceptionHandler:
     """Test base_api_exception_handler function."""
 
     @pytest.mark.asyncio
-    async def test_base_api_exception_handler(self, mock_request):
+    async def test_base_api_exception_handler(
+        self, mock_request, mock_log_error
+    ):
         """Test handling of BaseAPIException."""
         exc = BaseAPIException(
             message="Test error",
@@ -116,20 +142,20 @@ class TestBaseAPIExceptionHandler:
             details={"field": "value"},
         )
 
-        with patch("src.app.exception_handlers.log_error") as mock_log:
-            response = await base_api_exception_handler(mock_request, exc)
+        response = await base_api_exception_handler(mock_request, exc)
 
         # Verify logging was called
-        mock_log.assert_called_once()
-        call_args = mock_log.call_args
-        assert call_args[0][0] == exc  # First argument should be the exception
-        assert call_args[1]["request_id"] == "test-123"
+        mock_log_error.assert_called_once()
+        call_args = mock_log_error.call_args
+        # First argument should be the exception
+        assert call_args.args[0] == exc
+        assert call_args.kwargs["request_id"] == "test-123"
 
         # Verify response
         assert isinstance(response, JSONResponse)
         assert response.status_code == 400
 
-        content = json.loads(response.body)
+        content = orjson.loads(response.body)
         assert content["error"] == "TEST_ERROR"
         assert content["message"] == "Test error"
         assert content["details"]["field"] == "value"
@@ -146,44 +172,47 @@ class TestBaseAPIExceptionHandler:
             message="Test error", error_code="TEST_ERROR", status_code=400
         )
 
-        with patch("src.app.exception_handlers.log_error"):
-            response = await base_api_exception_handler(mock_request, exc)
+        response = await base_api_exception_handler(mock_request, exc)
 
-        content = json.loads(response.body)
         # Should generate a UUID for request_id
-        assert "request_id" in content
-        assert len(content["request_id"]) == 36  # UUID length
+        assert _UUID_RE.search(response.body) is not None
 
 
+@pytest.mark.usefixtures("mock_log_error")
 class TestValidationExceptionHandler:
     """Test validation_exception_handler function."""
 
+    @pytest.fixture(scope="class")
+    def sample_request_validation_error(self):
+        """Create a RequestValidationError shared by the class tests."""
+        return RequestValidationError(
+            errors=[
+                {
+                    "loc": ("body", "name"),
+                    "msg": "field required",
+                    "type": "value_error.missing",
+                },
+                {
+                    "loc": ("body", "number_of_parts"),
+                    "msg": "ensure this value is greater than 0",
+                    "type": "value_error.number.not_gt",
+                },
+            ]
+        )
+
     @pytest.mark.asyncio
-    async def test_validation_exception_handler(self, mock_request):
+    async def test_validation_exception_handler(
+        self, mock_request, sample_request_validation_error
+    ):
         """Test handling of RequestValidationError."""
-        # Create a mock validation error
-        errors = [
-            {
-                "loc": ("body", "name"),
-                "msg": "field required",
-                "type": "value_error.missing",
-            },
-            {
-                "loc": ("body", "number_of_parts"),
-                "msg": "ensure this value is greater than 0",
-                "type": "value_error.number.not_gt",
-            },
-        ]
-
-        exc = RequestValidationError(errors=errors)
-
-        with patch("src.app.exception_handlers.log_error"):
-            response = await validation_exception_handler(mock_request, exc)
+        response = await validation_exception_handler(
+            mock_request, sample_request_validation_error
+        )
 
         # Verify response
         assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
 
-        content = json.loads(response.body)
+        content = orjson.loads(response.body)
         assert content["error"] == "VALIDATION_ERROR"
         assert content["message"] == "Request validation failed"
 
@@ -196,60 +225,42 @@ class TestValidationExceptionHandler:
         )
 
     @pytest.mark.asyncio
-    @patch("src.app.exception_handlers.settings")
     async def test_validation_exception_handler_debug_mode(
-        self, mock_settings, mock_request
+        self, debug_on, mock_request, sample_request_validation_error
     ):
         """Test validation handler includes full errors in debug mode."""
-        mock_settings.debug = True
-
-        errors = [
-            {
-                "loc": ("body", "name"),
-                "msg": "field required",
-                "type": "value_error.missing",
-            }
-        ]
-        exc = RequestValidationError(errors=errors)
-
-        with patch("src.app.exception_handlers.log_error"):
-            response = await validation_exception_handler(mock_request, exc)
+        response = await validation_exception_handler(
+            mock_request, sample_request_validation_error
+        )
 
-        content = json.loads(response.body)
+        content = orjson.loads(response.body)
         # FastAPI may convert tuples to lists in the error response
         returned_errors = content["details"]["validation_errors"]
-        assert len(returned_errors) == 1
+        assert len(returned_errors) == 2
         assert returned_errors[0]["msg"] == "field required"
         assert returned_errors[0]["type"] == "value_error.missing"
         # loc can be either tuple or list, check that it contains the right values
         assert list(returned_errors[0]["loc"]) == ["body", "name"]
 
 
+@pytest.mark.usefixtures("mock_log_error")
 class TestPydanticValidationExceptionHandler:
     """Test pydantic_validation_exception_handler function."""
 
     @pytest.mark.asyncio
     async def test_pydantic_validation_exception_handler(self, mock_request):
         """Test handling of Pydantic ValidationError."""
-        # Create a mock Pydantic validation error
-        from pydantic import BaseModel, Field
-
-        class TestModel(BaseModel):
-            name: str = Field(..., min_length=1)
-            count: int = Field(..., gt=0)
-
         try:
-            TestModel(name="", count=-1)
+            SampleModel(name="", count=-1)
         except ValidationError as exc:
-            with patch("src.app.exception_handlers.log_error"):
-                response = await pydantic_validation_exception_handler(
-                    mock_request, exc
-                )
+            response = await pydantic_validation_exception_handler(
+                mock_request, exc
+            )
 
         # Verify response
         assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
 
-        content = json.loads(response.body)
+        content = orjson.loads(response.body)
         assert content["error"] == "VALIDATION_ERROR"
         assert content["message"] == "Data validation failed"
 
@@ -257,44 +268,47 @@ class TestPydanticValidationExceptionHandler:
         assert "field_errors" in content["details"]
 
 
+@pytest.mark.usefixtures("mock_log_error")
 class TestHTTPExceptionHandler:
     """Test http_exception_handler function."""
 
     @pytest.mark.asyncio
-    async def test_http_exception_handler_404(self, mock_request):
+    async def test_http_exception_handler_404(
+        self, mock_request, mock_log_error
+    ):
         """Test handling of 404 HTTP exception."""
         exc = StarletteHTTPException(status_code=404, detail="Not found")
 
-        with patch("src.app.exception_handlers.log_error") as mock_log:
-            response = await http_exception_handler(mock_request, exc)
+        response = await http_exception_handler(mock_request, exc)
 
         # 404 errors should not be logged (too common)
-        mock_log.assert_not_called()
+        mock_log_error.assert_not_called()
 
         # Verify response
         assert response.status_code == 404
 
-        content = json.loads(response.body)
+        content = orjson.loads(response.body)
         assert content["error"] == "RESOURCE_NOT_FOUND"
         assert content["message"] == "Not found"
 
     @pytest.mark.asyncio
-    async def test_http_exception_handler_405(self, mock_request):
+    async def test_http_exception_handler_405(
+        self, mock_request, mock_log_error
+    ):
         """Test handling of 405 HTTP exception."""
         exc = StarletteHTTPException(
             status_code=405, detail="Method not allowed"
         )
 
-        with patch("src.app.exception_handlers.log_error") as mock_log:
-            response = await http_exception_handler(mock_request, exc)
+        response = await http_exception_handler(mock_request, exc)
 
         # Non-404 errors should be logged
-        mock_log.assert_called_once()
+        mock_log_error.assert_called_once()
 
         # Verify response
         assert response.status_code == 405
 
-        content = json.loads(response.body)
+        content = orjson.loads(response.body)
         assert content["error"] == "METHOD_NOT_ALLOWED"
         assert content["message"] == "Method not allowed"
 
@@ -303,62 +317,54 @@ class TestHTTPExceptionHandler:
         """Test handling of HTTP exception with unmapped status code."""
         exc = StarletteHTTPException(status_code=418, detail="I'm a teapot")
 
-        with patch("src.app.exception_handlers.log_error"):
-            response = await http_exception_handler(mock_request, exc)
+        response = await http_exception_handler(mock_request, exc)
 
         # Verify response
         assert response.status_code == 418
 
-        content = json.loads(response.body)
+        content = orjson.loads(response.body)
         assert content["error"] == "HTTP_ERROR"
         assert content["message"] == "I'm a teapot"
 
 
+@pytest.mark.usefixtures("mock_log_error")
 class TestGenericExceptionHandler:
     """Test generic_exception_handler function."""
 
     @pytest.mark.asyncio
-    @patch("src.app.exception_handlers.settings")
     async def test_generic_exception_handler_production(
-        self, mock_settings, mock_request
+        self, debug_off, mock_request, mock_log_error
     ):
         """Test generic exception handler in production mode."""
-        mock_settings.debug = False
-
         exc = ValueError("Something went wrong")
 
-        with patch("src.app.exception_handlers.log_error") as mock_log:
-            response = await generic_exception_handler(mock_request, exc)
+        response = await generic_exception_handler(mock_request, exc)
 
         # Verify logging
-        mock_log.assert_called_once()
+        mock_log_error.assert_called_once()
 
         # Verify response
         assert response.status_code == 500
 
-        content = json.loads(response.body)
+        content = orjson.loads(response.body)
         assert content["error"] == "INTERNAL_SERVER_ERROR"
         assert content["message"] == "An unexpected error occurred"
         # Should not expose internal details in production
         assert "stack_trace" not in content.get("details", {})
 
     @pytest.mark.asyncio
-    @patch("src.app.exception_handlers.settings")
     async def test_generic_exception_handler_debug(
-        self, mock_settings, mock_request
+        self, debug_on, mock_request
     ):
         """Test generic exception handler in debug mode."""
-        mock_settings.debug = True
-
         exc = ValueError("Something went wrong")
 
-        with patch("src.app.exception_handlers.log_error"):
-            response = await generic_exception_handler(mock_request, exc)
+        response = await generic_exception_handler(mock_request, exc)
 
         # Verify response
         assert response.status_code == 500
 
-        content = json.loads(response.body)
+        content = orjson.loads(response.body)
         assert content["error"] == "INTERNAL_SERVER_ERROR"
         assert (
             "Internal server error: Something went wrong" in content["message"]
@@ -403,7 +409,7 @@ class TestRegisterExceptionHandlers:
 class TestExceptionHandlerIntegration:
     """Integration tests for exception handlers with FastAPI app."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def exception_test_app(self):
         """Create a test FastAPI app with exception handlers for testing exceptions."""
         app = FastAPI()
@@ -428,37 +434,35 @@ class TestExceptionHandlerIntegration:
 
         @app.post("/test/validation-error")
         async def test_validation_error(data: dict):
-            from pydantic import BaseModel, Field
-
-            class TestModel(BaseModel):
-                name: str = Field(..., min_length=1)
-                count: int = Field(..., gt=0)
-
             # This will trigger validation error
-            TestModel(**data)
+            SampleModel(**data)
             return {"status": "ok"}  # Should not reach here
 
         return app
 
-    def test_base_exception_integration(self, exception_test_app):
-        """Test BaseAPIException handling integration."""
+    @pytest.fixture(scope="class")
+    def client(self, exception_test_app):
+        """Create a test client shared by the integration tests."""
         with TestClient(exception_test_app) as client:
-            response = client.get("/test/base-exception")
+            yield client
+
+    def test_base_exception_integration(self, client):
+        """Test BaseAPIException handling integration."""
+        response = client.get("/test/base-exception")
 
         assert response.status_code == 400
-        data = response.json()
+        data = rjson(response)
         assert data["error"] == "TEST_ERROR"
         assert data["message"] == "Test error"
         assert "request_id" in data
         assert "timestamp" in data
 
-    def test_widget_not_found_integration(self, exception_test_app):
+    def test_widget_not_found_integration(self, client):
         """Test WidgetNotFoundException handling integration."""
-        with TestClient(exception_test_app) as client:
-            response = client.get("/test/widget-not-found")
+        response = client.get("/test/widget-not-found")
 
         assert response.status_code == 404
-        data = response.json()
+        data = rjson(response)
         assert data["error"] == "WIDGET_NOT_FOUND"
         assert "123" in data["message"]
 
@@ -470,14 +474,13 @@ class TestExceptionHandlerIntegration:
             "TestClient has middleware interaction issues with exception handlers"
         )
 
-    def test_validation_error_integration(self, exception_test_app):
+    def test_validation_error_integration(self, client):
         """Test validation error handling integration."""
-        with TestClient(exception_test_app) as client:
-            response = client.post(
-                "/test/validation-error", json={"name": "", "count": -1}
-            )
+        response = client.post(
+            "/test/validation-error", json={"name": "", "count": -1}
+        )
 
         assert response.status_code == 422
-        data = response.json()
+        data = rjson(response)
         assert data["error"] == "VALIDATION_ERROR"
         assert "field_errors" in data["details"]
@@ -6,6 +6,10 @@ format error responses, include correct status codes, and maintain
 consistent error structures.
 """
 
+from types import MappingProxyType
+
+import pytest
+
 from src.app.exceptions import (
     AuthenticationException,
     AuthorizationException,
@@ -22,72 +26,232 @@ from src.app.exceptions import (
     WidgetValidationException,
 )
 
+# Read-only so no test can mutate the shared sample data
+_FIELD_VALUE = MappingProxyType({"field": "value"})
 
-class TestBaseAPIException:
-    """Test BaseAPIException functionality."""
-
-    def test_basic_initialization(self):
-        """Test basic exception initialization."""
-        exc = BaseAPIException(
-            message="Test error", error_code="TEST_ERROR", status_code=400
-        )
-
-        assert exc.message == "Test error"
-        assert exc.error_code == "TEST_ERROR"
-        assert exc.status_code == 400
-        assert exc.details == {}
-        assert str(exc) == "Test error"
-
-    def test_initialization_with_details(self):
-        """Test exception initialization with details."""
-        details = {"field": "value", "count": 123}
-        exc = BaseAPIException(
-            message="Test error",
-            error_code="TEST_ERROR",
-            status_code=400,
-            details=details,
-        )
+_SAMPLE_EXC = BaseAPIException(
+    message="Test error",
+    error_code="TEST_ERROR",
+    status_code=400,
+    details=dict(_FIELD_VALUE),
+)
+_EXPECTED = MappingProxyType(
+    {"error": "TEST_ERROR", "message": "Test error", "details": _FIELD_VALUE}
+)
 
-        assert exc.details == details
+# (exception class, constructor kwargs, message, error code, status, details)
+EXCEPTION_CASES = [
+    (
+        BaseAPIException,
+        {
+            "message": "Test error",
+            "error_code": "TEST_ERROR",
+            "status_code": 400,
+        },
+        "Test error",
+        "TEST_ERROR",
+        400,
+        {},
+    ),
+    (
+        ValidationException,
+        {},
+        "Validation failed",
+        "VALIDATION_ERROR",
+        400,
+        {},
+    ),
+    (
+        ResourceNotFoundException,
+        {"resource_type": "Widget", "resource_id": 123},
+        "Widget with ID 123 not found",
+        "RESOURCE_NOT_FOUND",
+        404,
+        {"resource_type": "Widget", "resource_id": "123"},
+    ),
+    (
+        DatabaseException,
+        {},
+        "Database operation failed",
+        "DATABASE_ERROR",
+        500,
+        {},
+    ),
+    (
+        BusinessLogicException,
+        {"message": "Business rule violated"},
+        "Business rule violated",
+        "BUSINESS_LOGIC_ERROR",
+        400,
+        {},
+    ),
+    (
+        AuthenticationException,
+        {},
+        "Authentication required",
+        "AUTHENTICATION_ERROR",
+        401,
+        {},
+    ),
+    (
+        AuthorizationException,
+        {},
+        "Insufficient permissions",
+        "AUTHORIZATION_ERROR",
+        403,
+        {},
+    ),
+    (
+        RateLimitException,
+        {},
+        "Rate limit exceeded",
+        "RATE_LIMIT_ERROR",
+        429,
+        {},
+    ),
+    (
+        ExternalServiceException,
+        {"service_name": "payment_gateway"},
+        "External service unavailable",
+        "EXTERNAL_SERVICE_ERROR",
+        503,
+        {"service_name": "payment_gateway"},
+    ),
+    (
+        WidgetException,
+        {"message": "Widget error", "error_code": "WIDGET_ERROR"},
+        "Widget error",
+        "WIDGET_ERROR",
+        400,
+        {},
+    ),
+    (
+        WidgetNotFoundException,
+        {"widget_id": 123},
+        "Widget with ID 123 not found",
+        "WIDGET_NOT_FOUND",
+        404,
+        {"widget_id": 123},
+    ),
+    (
+        WidgetValidationException,
+        {"message": "Invalid widget data"},
+        "Invalid widget data",
+        "WIDGET_VALIDATION_ERROR",
+        400,
+        {},
+    ),
+    (
+        WidgetDuplicateException,
+        {"field": "name", "value": "Test Widget"},
+        "Widget with name 'Test Widget' already exists",
+        "WIDGET_DUPLICATE_ERROR",
+        409,
+        {"duplicate_field": "name", "duplicate_value": "Test Widget"},
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    "cls,kwargs,msg,code,status,details",
+    EXCEPTION_CASES,
+    ids=[case[0].__name__ for case in EXCEPTION_CASES],
+)
+def test_basic_init(cls, kwargs, msg, code, status, details):
+    """Test basic initialization of every exception class."""
+    exc = cls(**kwargs)
+
+    assert exc.message == msg
+    assert exc.error_code == code
+    assert exc.status_code == status
+    assert exc.details == details
+    assert str(exc) == msg
+
+
+# (exception class, constructor kwargs, custom message, expected details)
+CUSTOM_MESSAGE_CASES = [
+    (
+        ResourceNotFoundException,
+        {"resource_type": "User", "resource_id": "test@example.com"},
+        "User not found in system",
+        {"resource_type": "User", "resource_id": "test@example.com"},
+    ),
+    (
+        WidgetNotFoundException,
+        {"widget_id": 456},
+        "Specified widget does not exist",
+        {"widget_id": 456},
+    ),
+    (
+        WidgetDuplicateException,
+        {"field": "email", "value": "test@example.com"},
+        "Email address already registered",
+        {"duplicate_field": "email", "duplicate_value": "test@example.com"},
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    "cls,kwargs,msg,details",
+    CUSTOM_MESSAGE_CASES,
+    ids=[case[0].__name__ for case in CUSTOM_MESSAGE_CASES],
+)
+def test_custom_message(cls, kwargs, msg, details):
+    """Test a custom message replaces the formatted default message."""
+    exc = cls(message=msg, **kwargs)
+
+    assert exc.message == msg
+    assert exc.details == details
+
+
+@pytest.fixture(scope="module")
+def exc(request):
+    """Build the parametrized exception once per module."""
+    cls, kwargs = request.param
+    return cls(**kwargs)
+
+
+@pytest.mark.parametrize(
+    "exc",
+    [
+        (ValidationException, {}),
+        (DatabaseException, {}),
+        (
+            ResourceNotFoundException,
+            {"resource_type": "Widget", "resource_id": 1},
+        ),
+        (WidgetNotFoundException, {"widget_id": 1}),
+        (WidgetDuplicateException, {"field": "name", "value": "test"}),
+    ],
+    ids=lambda param: param[0].__name__,
+    indirect=True,
+)
+def test_to_dict(exc):
+    """Test to_dict mirrors the exception attributes for each subclass."""
+    assert exc.to_dict() == {
+        "error": exc.error_code,
+        "message": exc.message,
+        "details": exc.details,
+    }
 
-    def test_to_dict_method(self):
-        """Test to_dict method returns proper structure."""
-        details = {"field": "value"}
-        exc = BaseAPIException(
-            message="Test error",
-            error_code="TEST_ERROR",
-            status_code=400,
-            details=details,
-        )
 
-        result = exc.to_dict()
-        expected = {
-            "error": "TEST_ERROR",
-            "message": "Test error",
-            "details": details,
-        }
+class TestBaseAPIException:
+    """Test BaseAPIException functionality."""
 
-        assert result == expected
+    def test_base_api_exception(self):
+        """Test details, to_dict and the default status code."""
+        assert _SAMPLE_EXC.message == "Test error"
+        assert _SAMPLE_EXC.details == _FIELD_VALUE
+        assert _SAMPLE_EXC.to_dict() == _EXPECTED
 
-    def test_default_status_code(self):
-        """Test default status code is 500."""
         exc = BaseAPIException(message="Test error", error_code="TEST_ERROR")
-
         assert exc.status_code == 500
+        assert exc.details == {}
 
 
 class TestValidationException:
     """Test ValidationException functionality."""
 
-    def test_basic_initialization(self):
-        """Test basic validation exception."""
-        exc = ValidationException()
-
-        assert exc.message == "Validation failed"
-        assert exc.error_code == "VALIDATION_ERROR"
-        assert exc.status_code == 400
-        assert exc.details == {}
-
     def test_initialization_with_field_errors(self):
         """Test validation exception with field errors."""
         field_errors = {"name": "Required field", "count": "Must be positive"}
@@ -114,29 +278,6 @@ class TestValidationException:
 class TestResourceNotFoundException:
     """Test ResourceNotFoundException functionality."""
 
-    def test_basic_initialization(self):
-        """Test basic resource not found exception."""
-        exc = ResourceNotFoundException(
-            resource_type="Widget", resource_id=123
-        )
-
-        assert exc.message == "Widget with ID 123 not found"
-        assert exc.error_code == "RESOURCE_NOT_FOUND"
-        assert exc.status_code == 404
-        assert exc.details["resource_type"] == "Widget"
-        assert exc.details["resource_id"] == "123"
-
-    def test_custom_message(self):
-        """Test resource not found with custom message."""
-        exc = ResourceNotFoundException(
-            resource_type="User",
-            resource_id="test@example.com",
-            message="User not found in system",
-        )
-
-        assert exc.message == "User not found in system"
-        assert exc.details["resource_id"] == "test@example.com"
-
     def test_string_resource_id(self):
         """Test with string resource ID."""
         exc = ResourceNotFoundException(
@@ -149,15 +290,6 @@ class TestResourceNotFoundException:
 class TestDatabaseException:
     """Test DatabaseException functionality."""
 
-    def test_basic_initialization(self):
-        """Test basic database exception."""
-        exc = DatabaseException()
-
-        assert exc.message == "Database operation failed"
-        assert exc.error_code == "DATABASE_ERROR"
-        assert exc.status_code == 500
-        assert exc.details == {}
-
     def test_initialization_with_operation(self):
         """Test database exception with operation context."""
         exc = DatabaseException(
@@ -180,14 +312,6 @@ class TestDatabaseException:
 class TestBusinessLogicException:
     """Test BusinessLogicException functionality."""
 
-    def test_basic_initialization(self):
-        """Test basic business logic exception."""
-        exc = BusinessLogicException(message="Business rule violated")
-
-        assert exc.message == "Business rule violated"
-        assert exc.error_code == "BUSINESS_LOGIC_ERROR"
-        assert exc.status_code == 400
-
     def test_initialization_with_rule(self):
         """Test business logic exception with rule context."""
         exc = BusinessLogicException(
@@ -201,14 +325,6 @@ class TestBusinessLogicException:
 class TestAuthenticationException:
     """Test AuthenticationException functionality."""
 
-    def test_basic_initialization(self):
-        """Test basic authentication exception."""
-        exc = AuthenticationException()
-
-        assert exc.message == "Authentication required"
-        assert exc.error_code == "AUTHENTICATION_ERROR"
-        assert exc.status_code == 401
-
     def test_custom_message(self):
         """Test authentication exception with custom message."""
         exc = AuthenticationException(message="Invalid credentials")
@@ -219,14 +335,6 @@ class TestAuthenticationException:
 class TestAuthorizationException:
     """Test AuthorizationException functionality."""
 
-    def test_basic_initialization(self):
-        """Test basic authorization exception."""
-        exc = AuthorizationException()
-
-        assert exc.message == "Insufficient permissions"
-        assert exc.error_code == "AUTHORIZATION_ERROR"
-        assert exc.status_code == 403
-
     def test_initialization_with_resource_and_action(self):
         """Test authorization exception with resource and action."""
         exc = AuthorizationException(
@@ -242,14 +350,6 @@ class TestAuthorizationException:
 class TestRateLimitException:
     """Test RateLimitException functionality."""
 
-    def test_basic_initialization(self):
-        """Test basic rate limit exception."""
-        exc = RateLimitException()
-
-        assert exc.message == "Rate limit exceeded"
-        assert exc.error_code == "RATE_LIMIT_ERROR"
-        assert exc.status_code == 429
-
     def test_initialization_with_retry_after(self):
         """Test rate limit exception with retry after."""
         exc = RateLimitException(message="Too many requests", retry_after=60)
@@ -261,15 +361,6 @@ class TestRateLimitException:
 class TestExternalServiceException:
     """Test ExternalServiceException functionality."""
 
-    def test_basic_initialization(self):
-        """Test basic external service exception."""
-        exc = ExternalServiceException(service_name="payment_gateway")
-
-        assert exc.message == "External service unavailable"
-        assert exc.error_code == "EXTERNAL_SERVICE_ERROR"
-        assert exc.status_code == 503
-        assert exc.details["service_name"] == "payment_gateway"
-
     def test_custom_message(self):
         """Test external service exception with custom message."""
         exc = ExternalServiceException(
@@ -283,17 +374,6 @@ class TestExternalServiceException:
 class TestWidgetException:
     """Test WidgetException functionality."""
 
-    def test_basic_initialization(self):
-        """Test basic widget exception."""
-        exc = WidgetException(
-            message="Widget error", error_code="WIDGET_ERROR"
-        )
-
-        assert exc.message == "Widget error"
-        assert exc.error_code == "WIDGET_ERROR"
-        assert exc.status_code == 400
-        assert exc.details == {}
-
     def test_initialization_with_widget_id(self):
         """Test widget exception with widget ID."""
         exc = WidgetException(
@@ -311,39 +391,9 @@ class TestWidgetException:
         assert exc.status_code == 422
 
 
-class TestWidgetNotFoundException:
-    """Test WidgetNotFoundException functionality."""
-
-    def test_basic_initialization(self):
-        """Test basic widget not found exception."""
-        exc = WidgetNotFoundException(widget_id=123)
-
-        assert exc.message == "Widget with ID 123 not found"
-        assert exc.error_code == "WIDGET_NOT_FOUND"
-        assert exc.status_code == 404
-        assert exc.details["widget_id"] == 123
-
-    def test_custom_message(self):
-        """Test widget not found with custom message."""
-        exc = WidgetNotFoundException(
-            widget_id=456, message="Specified widget does not exist"
-        )
-
-        assert exc.message == "Specified widget does not exist"
-        assert exc.details["widget_id"] == 456
-
-
 class TestWidgetValidationException:
     """Test WidgetValidationException functionality."""
 
-    def test_basic_initialization(self):
-        """Test basic widget validation exception."""
-        exc = WidgetValidationException(message="Invalid widget data")
-
-        assert exc.message == "Invalid widget data"
-        assert exc.error_code == "WIDGET_VALIDATION_ERROR"
-        assert exc.status_code == 400
-
     def test_initialization_with_field_errors(self):
         """Test widget validation exception with field errors."""
         field_errors = {"name": "Too long", "parts": "Must be positive"}
@@ -357,31 +407,28 @@ class TestWidgetValidationException:
         assert exc.details["widget_id"] == 123
 
 
-class TestWidgetDuplicateException:
-    """Test WidgetDuplicateException functionality."""
+_REQUIRED_ATTRS = frozenset(
+    ("message", "error_code", "status_code", "details", "to_dict")
+)
 
-    def test_basic_initialization(self):
-        """Test basic widget duplicate exception."""
-        exc = WidgetDuplicateException(field="name", value="Test Widget")
 
-        expected_message = "Widget with name 'Test Widget' already exists"
-        assert exc.message == expected_message
-        assert exc.error_code == "WIDGET_DUPLICATE_ERROR"
-        assert exc.status_code == 409
-        assert exc.details["duplicate_field"] == "name"
-        assert exc.details["duplicate_value"] == "Test Widget"
-
-    def test_custom_message(self):
-        """Test widget duplicate exception with custom message."""
-        exc = WidgetDuplicateException(
-            field="email",
-            value="test@example.com",
-            message="Email address already registered",
-        )
-
-        assert exc.message == "Email address already registered"
-        assert exc.details["duplicate_field"] == "email"
-        assert exc.details["duplicate_value"] == "test@example.com"
+@pytest.fixture(scope="session")
+def all_exception_instances():
+    """Provide one instance of every exception class, built once."""
+    return [
+        ValidationException(),
+        ResourceNotFoundException("Test", 1),
+        DatabaseException(),
+        BusinessLogicException("test"),
+        AuthenticationException(),
+        AuthorizationException(),
+        RateLimitException(),
+        ExternalServiceException("test"),
+        WidgetException("test", "TEST"),
+        WidgetNotFoundException(1),
+        WidgetValidationException("test"),
+        WidgetDuplicateException("name", "test"),
+    ]
 
 
 class TestExceptionInheritance:
@@ -393,31 +440,20 @@ class TestExceptionInheritance:
         validation = WidgetValidationException(message="test")
         duplicate = WidgetDuplicateException(field="name", value="test")
 
-        assert isinstance(not_found, WidgetException)
-        assert isinstance(validation, WidgetException)
-        assert isinstance(duplicate, WidgetException)
+        mros = [type(x).__mro__ for x in (not_found, validation, duplicate)]
+        assert all(WidgetException in mro for mro in mros)
 
-    def test_all_exceptions_inherit_from_base(self):
+    def test_all_exceptions_inherit_from_base(self, all_exception_instances):
         """Test all exceptions inherit from BaseAPIException."""
-        exceptions = [
-            ValidationException(),
-            ResourceNotFoundException("Test", 1),
-            DatabaseException(),
-            BusinessLogicException("test"),
-            AuthenticationException(),
-            AuthorizationException(),
-            RateLimitException(),
-            ExternalServiceException("test"),
-            WidgetException("test", "TEST"),
-            WidgetNotFoundException(1),
-            WidgetValidationException("test"),
-            WidgetDuplicateException("name", "test"),
-        ]
-
-        for exc in exceptions:
-            assert isinstance(exc, BaseAPIException)
-            assert hasattr(exc, "message")
-            assert hasattr(exc, "error_code")
-            assert hasattr(exc, "status_code")
-            assert hasattr(exc, "details")
-            assert hasattr(exc, "to_dict")
+        assert all(
+            BaseAPIException in type(exc).__mro__
+            for exc in all_exception_instances
+        )
+
+    def test_all_exceptions_expose_base_api(self, all_exception_instances):
+        """Test all exceptions expose the shared BaseAPIException API."""
+        for exc in all_exception_instances:
+            attrs = set(vars(exc))
+            for klass in type(exc).__mro__:
+                attrs.update(vars(klass))
+            assert _REQUIRED_ATTRS <= attrs
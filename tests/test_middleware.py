@@ -6,10 +6,11 @@ handle request/response processing, logging, validation, and
 error tracking.
 """
 
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
-from fastapi import FastAPI, Request, Response
+from fastapi import FastAPI, Response
 from fastapi.testclient import TestClient
 
 from src.app.exceptions import ValidationException
@@ -21,27 +22,49 @@ from src.app.middleware import (
 )
 
 
+def _fake_request(
+    method="GET", path="/api/widgets", headers=None, client_host=None
+):
+    """Build a plain request stand-in carrying only what dispatch reads."""
+    return SimpleNamespace(
+        method=method,
+        url=SimpleNamespace(path=path),
+        headers=headers or {},
+        client=SimpleNamespace(host=client_host) if client_host else None,
+        state=SimpleNamespace(),
+    )
+
+
+# _get_client_ip reads only the request, so one instance serves every case
+_LOGGING_MIDDLEWARE = RequestLoggingMiddleware(app=Mock())
+
+
+@pytest.fixture
+def patched_loggers():
+    """Patch the middleware's request and response log helpers."""
+    with (
+        patch("src.app.middleware.log_request_info") as log_request,
+        patch("src.app.middleware.log_response_info") as log_response,
+    ):
+        yield log_request, log_response
+
+
 class TestRequestLoggingMiddleware:
     """Test RequestLoggingMiddleware functionality."""
 
     @pytest.mark.asyncio
     async def test_request_logging_middleware_success(
-        self, mock_request, mock_response
+        self, mock_request, mock_response, patched_loggers
     ):
         """Test middleware logs successful requests."""
         middleware = RequestLoggingMiddleware(app=Mock())
 
         # Mock the call_next function
         async def mock_call_next(request):
-            # Simulate processing time
-            await AsyncMock()()
             return mock_response
 
-        with (
-            patch("src.app.middleware.log_request_info") as mock_log_request,
-            patch("src.app.middleware.log_response_info") as mock_log_response,
-        ):
-            await middleware.dispatch(mock_request, mock_call_next)
+        mock_log_request, mock_log_response = patched_loggers
+        await middleware.dispatch(mock_request, mock_call_next)
 
         # Verify request ID was set
         assert hasattr(mock_request.state, "request_id")
@@ -49,17 +72,17 @@ class TestRequestLoggingMiddleware:
 
         # Verify request was logged
         mock_log_request.assert_called_once()
-        call_args = mock_log_request.call_args
-        assert call_args[1]["request_id"] == mock_request.state.request_id
-        assert call_args[1]["method"] == "GET"
-        assert call_args[1]["path"] == "/api/widgets"
+        request_kwargs = mock_log_request.call_args.kwargs
+        assert request_kwargs["request_id"] == mock_request.state.request_id
+        assert request_kwargs["method"] == "GET"
+        assert request_kwargs["path"] == "/api/widgets"
 
         # Verify response was logged
         mock_log_response.assert_called_once()
-        response_args = mock_log_response.call_args
-        assert response_args[1]["request_id"] == mock_request.state.request_id
-        assert response_args[1]["status_code"] == 200
-        assert "duration_ms" in response_args[1]
+        response_kwargs = mock_log_response.call_args.kwargs
+        assert response_kwargs["request_id"] == mock_request.state.request_id
+        assert response_kwargs["status_code"] == 200
+        assert "duration_ms" in response_kwargs
 
         # Verify X-Request-ID header was added
         assert (
@@ -68,7 +91,9 @@ class TestRequestLoggingMiddleware:
         )
 
     @pytest.mark.asyncio
-    async def test_request_logging_middleware_exception(self, mock_request):
+    async def test_request_logging_middleware_exception(
+        self, mock_request, patched_loggers
+    ):
         """Test middleware logs exceptions properly."""
         middleware = RequestLoggingMiddleware(app=Mock())
 
@@ -76,82 +101,56 @@ class TestRequestLoggingMiddleware:
         async def mock_call_next(request):
             raise ValueError("Test error")
 
-        with (
-            patch("src.app.middleware.log_request_info"),
-            patch("src.app.middleware.log_response_info") as mock_log_response,
-        ):
-            with pytest.raises(ValueError):
-                await middleware.dispatch(mock_request, mock_call_next)
+        _, mock_log_response = patched_loggers
+        with pytest.raises(ValueError):
+            await middleware.dispatch(mock_request, mock_call_next)
 
         # Verify error response was logged
         mock_log_response.assert_called_once()
-        response_args = mock_log_response.call_args
-        assert response_args[1]["status_code"] == 500
-        assert "duration_ms" in response_args[1]
-
-    def test_get_client_ip_direct_connection(self):
-        """Test client IP extraction from direct connection."""
-        middleware = RequestLoggingMiddleware(app=Mock())
-
-        request = Mock()
-        request.headers = {}
-        request.client = Mock()
-        request.client.host = "192.168.1.100"
-
-        ip = middleware._get_client_ip(request)
-        assert ip == "192.168.1.100"
-
-    def test_get_client_ip_proxy_headers(self):
-        """Test client IP extraction from proxy headers."""
-        middleware = RequestLoggingMiddleware(app=Mock())
-
-        request = Mock()
-        request.headers = {
-            "x-forwarded-for": "203.0.113.195, 70.41.3.18, 150.172.238.178",
-            "x-real-ip": "203.0.113.195",
-        }
-        request.client = Mock()
-        request.client.host = "192.168.1.100"
-
-        # Should return the first IP from X-Forwarded-For
-        ip = middleware._get_client_ip(request)
-        assert ip == "203.0.113.195"
-
-    def test_get_client_ip_cloudflare(self):
-        """Test client IP extraction from Cloudflare header."""
-        middleware = RequestLoggingMiddleware(app=Mock())
-
-        request = Mock()
-        request.headers = {"cf-connecting-ip": "203.0.113.195"}
-        request.client = Mock()
-        request.client.host = "192.168.1.100"
-
-        ip = middleware._get_client_ip(request)
-        assert ip == "203.0.113.195"
-
-    def test_get_client_ip_no_client(self):
-        """Test client IP when no client info available."""
-        middleware = RequestLoggingMiddleware(app=Mock())
-
-        request = Mock()
-        request.headers = {}
-        request.client = None
-
-        ip = middleware._get_client_ip(request)
-        assert ip == "unknown"
+        response_kwargs = mock_log_response.call_args.kwargs
+        assert response_kwargs["status_code"] == 500
+        assert "duration_ms" in response_kwargs
+
+    @pytest.mark.parametrize(
+        "headers,client_host,expected",
+        [
+            ({}, "192.168.1.100", "192.168.1.100"),
+            (
+                {
+                    "x-forwarded-for": (
+                        "203.0.113.195, 70.41.3.18, 150.172.238.178"
+                    ),
+                    "x-real-ip": "203.0.113.195",
+                },
+                "192.168.1.100",
+                # Should return the first IP from X-Forwarded-For
+                "203.0.113.195",
+            ),
+            (
+                {"cf-connecting-ip": "203.0.113.195"},
+                "192.168.1.100",
+                "203.0.113.195",
+            ),
+            ({}, None, "unknown"),
+        ],
+        ids=["direct_connection", "proxy_headers", "cloudflare", "no_client"],
+    )
+    def test_get_client_ip(self, headers, client_host, expected):
+        """Test client IP extraction from headers and connection info."""
+        request = _fake_request(headers=headers, client_host=client_host)
+
+        assert _LOGGING_MIDDLEWARE._get_client_ip(request) == expected
+
+    @pytest.fixture(scope="class")
+    def client(self, app_with_middleware):
+        """Create a test client shared by the class."""
+        with TestClient(app_with_middleware) as client:
+            yield client
 
-    def test_integration_with_fastapi(self, app_with_middleware):
+    def test_integration_with_fastapi(self, client, patched_loggers):
         """Test middleware integration with FastAPI."""
-        with TestClient(app_with_middleware) as client:
-            with (
-                patch(
-                    "src.app.middleware.log_request_info"
-                ) as mock_log_request,
-                patch(
-                    "src.app.middleware.log_response_info"
-                ) as mock_log_response,
-            ):
-                response = client.get("/test")
+        mock_log_request, mock_log_response = patched_loggers
+        response = client.get("/test")
 
         assert response.status_code == 200
         assert "X-Request-ID" in response.headers
@@ -164,7 +163,7 @@ class TestRequestLoggingMiddleware:
 class TestRequestValidationMiddleware:
     """Test RequestValidationMiddleware functionality."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="session")
     def middleware(self):
         """Create middleware instance."""
         return RequestValidationMiddleware(app=Mock())
@@ -182,11 +181,7 @@ class TestRequestValidationMiddleware:
     @pytest.mark.asyncio
     async def test_invalid_content_type(self, middleware):
         """Test middleware rejects invalid content-type."""
-        request = Mock(spec=Request)
-        request.method = "POST"
-        request.url = Mock()
-        request.url.path = "/api/widgets"
-        request.headers = {"content-type": "text/plain"}
+        request = _fake_request("POST", headers={"content-type": "text/plain"})
 
         async def mock_call_next(request):
             return Response(status_code=200)
@@ -199,11 +194,7 @@ class TestRequestValidationMiddleware:
     @pytest.mark.asyncio
     async def test_missing_content_type_post(self, middleware):
         """Test middleware rejects POST requests without content-type."""
-        request = Mock(spec=Request)
-        request.method = "POST"
-        request.url = Mock()
-        request.url.path = "/api/widgets"
-        request.headers = {}
+        request = _fake_request("POST")
 
         async def mock_call_next(request):
             return Response(status_code=200)
@@ -214,11 +205,7 @@ class TestRequestValidationMiddleware:
     @pytest.mark.asyncio
     async def test_delete_method_no_content_type_check(self, middleware):
         """Test DELETE method doesn't require content-type."""
-        request = Mock(spec=Request)
-        request.method = "DELETE"
-        request.url = Mock()
-        request.url.path = "/api/widgets/123"
-        request.headers = {}
+        request = _fake_request("DELETE", "/api/widgets/123")
 
         async def mock_call_next(request):
             return Response(status_code=204)
@@ -229,11 +216,9 @@ class TestRequestValidationMiddleware:
     @pytest.mark.asyncio
     async def test_docs_endpoint_excluded(self, middleware):
         """Test docs endpoints are excluded from validation."""
-        request = Mock(spec=Request)
-        request.method = "POST"
-        request.url = Mock()
-        request.url.path = "/docs"
-        request.headers = {"content-type": "text/html"}
+        request = _fake_request(
+            "POST", "/docs", headers={"content-type": "text/html"}
+        )
 
         async def mock_call_next(request):
             return Response(status_code=200)
@@ -244,14 +229,13 @@ class TestRequestValidationMiddleware:
     @pytest.mark.asyncio
     async def test_request_size_validation(self, middleware):
         """Test request size validation."""
-        request = Mock(spec=Request)
-        request.method = "POST"
-        request.url = Mock()
-        request.url.path = "/api/widgets"
-        request.headers = {
-            "content-type": "application/json",
-            "content-length": str(20 * 1024 * 1024),  # 20MB
-        }
+        request = _fake_request(
+            "POST",
+            headers={
+                "content-type": "application/json",
+                "content-length": str(20 * 1024 * 1024),  # 20MB
+            },
+        )
 
         async def mock_call_next(request):
             return Response(status_code=200)
@@ -264,14 +248,13 @@ class TestRequestValidationMiddleware:
     @pytest.mark.asyncio
     async def test_invalid_content_length(self, middleware):
         """Test invalid content-length header."""
-        request = Mock(spec=Request)
-        request.method = "POST"
-        request.url = Mock()
-        request.url.path = "/api/widgets"
-        request.headers = {
-            "content-type": "application/json",
-            "content-length": "invalid",
-        }
+        request = _fake_request(
+            "POST",
+            headers={
+                "content-type": "application/json",
+                "content-length": "invalid",
+            },
+        )
 
         async def mock_call_next(request):
             return Response(status_code=200)
@@ -285,7 +268,7 @@ class TestRequestValidationMiddleware:
 class TestSecurityHeadersMiddleware:
     """Test SecurityHeadersMiddleware functionality."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def app_with_security_middleware(self):
         """Create a FastAPI app with security headers middleware."""
         app = FastAPI()
@@ -297,10 +280,15 @@ class TestSecurityHeadersMiddleware:
 
         return app
 
-    def test_security_headers_added(self, app_with_security_middleware):
-        """Test security headers are added to responses."""
+    @pytest.fixture(scope="class")
+    def client(self, app_with_security_middleware):
+        """Create a test client shared by the class."""
         with TestClient(app_with_security_middleware) as client:
-            response = client.get("/test")
+            yield client
+
+    def test_security_headers_added(self, client):
+        """Test security headers are added to responses."""
+        response = client.get("/test")
 
         assert response.status_code == 200
 
@@ -321,60 +309,65 @@ class TestSecurityHeadersMiddleware:
 class TestErrorTrackingMiddleware:
     """Test ErrorTrackingMiddleware functionality."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="session")
     def middleware(self):
         """Create middleware instance."""
         return ErrorTrackingMiddleware(app=Mock())
 
     @pytest.mark.asyncio
     async def test_successful_request_no_tracking(
-        self, middleware, mock_request
+        self, middleware, mock_request, monkeypatch
     ):
         """Test successful requests don't trigger error tracking."""
-        response = Mock(spec=Response)
-        response.status_code = 200
+        response = SimpleNamespace(status_code=200, headers={})
 
         async def mock_call_next(request):
             return response
 
-        with patch.object(
-            middleware, "_track_error_response"
-        ) as mock_track_error:
-            result = await middleware.dispatch(mock_request, mock_call_next)
+        mock_track_error = AsyncMock()
+        monkeypatch.setattr(
+            middleware, "_track_error_response", mock_track_error
+        )
+        result = await middleware.dispatch(mock_request, mock_call_next)
 
         assert result == response
         mock_track_error.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_error_response_tracking(self, middleware, mock_request):
+    async def test_error_response_tracking(
+        self, middleware, mock_request, monkeypatch
+    ):
         """Test error responses trigger tracking."""
-        response = Mock(spec=Response)
-        response.status_code = 400
+        response = SimpleNamespace(status_code=400, headers={})
 
         async def mock_call_next(request):
             return response
 
-        with patch.object(
-            middleware, "_track_error_response"
-        ) as mock_track_error:
-            result = await middleware.dispatch(mock_request, mock_call_next)
+        mock_track_error = AsyncMock()
+        monkeypatch.setattr(
+            middleware, "_track_error_response", mock_track_error
+        )
+        result = await middleware.dispatch(mock_request, mock_call_next)
 
         assert result == response
         mock_track_error.assert_called_once_with(mock_request, response)
 
     @pytest.mark.asyncio
-    async def test_exception_tracking(self, middleware, mock_request):
+    async def test_exception_tracking(
+        self, middleware, mock_request, monkeypatch
+    ):
         """Test exceptions trigger tracking."""
         test_exception = ValueError("Test error")
 
         async def mock_call_next(request):
             raise test_exception
 
-        with patch.object(
-            middleware, "_track_exception"
-        ) as mock_track_exception:
-            with pytest.raises(ValueError):
-                await middleware.dispatch(mock_request, mock_call_next)
+        mock_track_exception = AsyncMock()
+        monkeypatch.setattr(
+            middleware, "_track_exception", mock_track_exception
+        )
+        with pytest.raises(ValueError):
+            await middleware.dispatch(mock_request, mock_call_next)
 
         mock_track_exception.assert_called_once_with(
             mock_request, test_exception
@@ -385,17 +378,17 @@ class TestErrorTrackingMiddleware:
         self, middleware, mock_request
     ):
         """Test error response tracking logs properly."""
-        response = Mock(spec=Response)
-        response.status_code = 404
+        response = SimpleNamespace(status_code=404, headers={})
 
         with patch("src.app.middleware.logger") as mock_logger:
             await middleware._track_error_response(mock_request, response)
 
         mock_logger.warning.assert_called_once()
         call_args = mock_logger.warning.call_args
-        assert "Error response: 404" in call_args[0][0]
-        assert call_args[1]["extra"]["status_code"] == 404
-        assert call_args[1]["extra"]["request_id"] == "test-123"
+        extra = call_args.kwargs["extra"]
+        assert "Error response: 404" in call_args.args[0]
+        assert extra["status_code"] == 404
+        assert extra["request_id"] == "test-123"
 
     @pytest.mark.asyncio
     async def test_track_exception_logging(self, middleware, mock_request):
@@ -407,16 +400,17 @@ class TestErrorTrackingMiddleware:
 
         mock_logger.error.assert_called_once()
         call_args = mock_logger.error.call_args
-        assert "Exception in GET /api/widgets" in call_args[0][0]
-        assert call_args[1]["extra"]["exception_type"] == "ValueError"
-        assert call_args[1]["extra"]["request_id"] == "test-123"
-        assert call_args[1]["exc_info"] is True
+        extra = call_args.kwargs["extra"]
+        assert "Exception in GET /api/widgets" in call_args.args[0]
+        assert extra["exception_type"] == "ValueError"
+        assert extra["request_id"] == "test-123"
+        assert call_args.kwargs["exc_info"] is True
 
 
 class TestMiddlewareIntegration:
     """Integration tests for multiple middleware together."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def app_with_all_middleware(self):
         """Create a FastAPI app with all middleware."""
         from src.app.exception_handlers import register_exception_handlers
@@ -446,18 +440,16 @@ class TestMiddlewareIntegration:
 
         return app
 
-    def test_all_middleware_integration_success(self, app_with_all_middleware):
-        """Test all middleware work together for successful request."""
+    @pytest.fixture(scope="class")
+    def client(self, app_with_all_middleware):
+        """Create a test client shared by the class."""
         with TestClient(app_with_all_middleware) as client:
-            with (
-                patch(
-                    "src.app.middleware.log_request_info"
-                ) as mock_log_request,
-                patch(
-                    "src.app.middleware.log_response_info"
-                ) as mock_log_response,
-            ):
-                response = client.get("/test")
+            yield client
+
+    def test_all_middleware_integration_success(self, client, patched_loggers):
+        """Test all middleware work together for successful request."""
+        mock_log_request, mock_log_response = patched_loggers
+        response = client.get("/test")
 
         assert response.status_code == 200
         assert "X-Request-ID" in response.headers
@@ -487,10 +479,9 @@ class TestMiddlewareIntegration:
             "TestClient has middleware/exception handler interaction issues"
         )
 
-    def test_middleware_order_matters(self):
+    @pytest.mark.asyncio
+    async def test_middleware_order_matters(self):
         """Test that middleware order affects execution."""
-        app = FastAPI()
-
         execution_order = []
 
         class TestMiddleware1(RequestLoggingMiddleware):
@@ -507,20 +498,46 @@ class TestMiddlewareIntegration:
                 execution_order.append("middleware2_end")
                 return response
 
-        # Add in specific order
-        app.add_middleware(TestMiddleware2)  # Added second, executes first
-        app.add_middleware(TestMiddleware1)  # Added first, executes last
+        app = FastAPI()
 
         @app.get("/test")
-        async def test_endpoint():
+        async def endpoint():
             execution_order.append("endpoint")
-            return {"message": "success"}
+            return {"message": "test"}
+
+        # The last middleware added becomes the outermost layer
+        app.add_middleware(TestMiddleware2)
+        app.add_middleware(TestMiddleware1)
+        stack = app.build_middleware_stack()
+
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": "GET",
+            "scheme": "http",
+            "path": "/test",
+            "raw_path": b"/test",
+            "root_path": "",
+            "query_string": b"",
+            "headers": [],
+            "client": ("testclient", 50000),
+            "server": ("testserver", 80),
+            "app": app,
+        }
+        sent = []
 
-        with TestClient(app) as client:
-            response = client.get("/test")
+        async def receive():
+            return {"type": "http.request", "body": b"", "more_body": False}
 
-        assert response.status_code == 200
-        # Middleware execution order: last added executes first
+        async def send(message):
+            sent.append(message)
+
+        await stack(scope, receive, send)
+
+        assert sent[0]["type"] == "http.response.start"
+        assert sent[0]["status"] == 200
+        # Outer middleware wraps the inner one around the endpoint
         expected_order = [
             "middleware1_start",  # TestMiddleware1 starts first
             "middleware2_start",  # TestMiddleware2 starts second
@@ -8,38 +8,32 @@ pagination, error handling, and database interactions.
 import pytest
 import pytest_asyncio
 
-from src.app.database import TestAsyncSessionLocal
 from src.app.exceptions import WidgetNotFoundException
 from src.app.repositories.widget import PaginationResult, WidgetRepository
 from src.app.schemas.widget import WidgetCreate, WidgetUpdate
 
-# Database setup is handled by the autouse fixture in conftest.py
+_MAX_NAME_64 = "a" * 64
+_SAMPLE_WIDGETS = (
+    WidgetCreate(name="Widget A", number_of_parts=5),
+    WidgetCreate(name="Widget B", number_of_parts=10),
+    WidgetCreate(name="Widget C", number_of_parts=15),
+    WidgetCreate(name="Test Widget", number_of_parts=20),
+    WidgetCreate(name="Another Widget", number_of_parts=25),
+)
 
-
-@pytest_asyncio.fixture
-async def widget_repo():
-    """Create a widget repository for testing."""
-    async with TestAsyncSessionLocal() as session:
-        repo = WidgetRepository(session)
-        yield repo
+# Database setup is handled by the autouse fixtures in conftest.py
 
 
-async def create_sample_widgets(repo: WidgetRepository):
-    """Helper function to create sample widgets in a repository."""
-    widgets = []
-    sample_data = [
-        WidgetCreate(name="Widget A", number_of_parts=5),
-        WidgetCreate(name="Widget B", number_of_parts=10),
-        WidgetCreate(name="Widget C", number_of_parts=15),
-        WidgetCreate(name="Test Widget", number_of_parts=20),
-        WidgetCreate(name="Another Widget", number_of_parts=25),
-    ]
+@pytest.fixture
+def widget_repo(db_session):
+    """Create a widget repository over the rolled-back test session."""
+    return WidgetRepository(db_session)
 
-    for widget_data in sample_data:
-        widget = await repo.create(widget_data)
-        widgets.append(widget)
 
-    return widgets
+@pytest_asyncio.fixture
+async def sample_widgets(widgets_factory):
+    """Seed the sample widgets through the rolled-back test session."""
+    return await widgets_factory(w.model_dump() for w in _SAMPLE_WIDGETS)
 
 
 class TestWidgetRepositoryCreate:
@@ -73,7 +67,7 @@ class TestWidgetRepositoryCreate:
     @pytest.mark.asyncio
     async def test_create_widget_with_max_name_length(self, widget_repo):
         """Test widget creation with maximum name length."""
-        long_name = "a" * 64  # Maximum allowed length
+        long_name = _MAX_NAME_64  # Maximum allowed length
         widget_data = WidgetCreate(name=long_name, number_of_parts=1)
 
         widget = await widget_repo.create(widget_data)
@@ -81,28 +75,34 @@ class TestWidgetRepositoryCreate:
         assert widget.name == long_name
         assert widget.number_of_parts == 1
 
-    @pytest.mark.asyncio
-    async def test_create_widget_database_error_rollback(self, widget_repo):
-        """Test that database errors are properly handled with rollback."""
-        # Create a widget with invalid data that will cause violation
-        # Note: This validates Pydantic schema validation, which prevents
-        # invalid data from reaching the repository
-        with pytest.raises(ValueError):
-            # This should fail at Pydantic validation level
-            WidgetCreate(name="Test", number_of_parts=0)
-
-        # Verify no widget was created
-        result = await widget_repo.get_all()
-        assert len(result.items) == 0
+
+@pytest.mark.parametrize(
+    "schema, kwargs",
+    [
+        (WidgetCreate, {"name": "Test", "number_of_parts": 0}),
+        (WidgetCreate, {"name": "", "number_of_parts": 5}),
+        (WidgetUpdate, {"number_of_parts": 0}),
+        (WidgetUpdate, {"name": ""}),
+    ],
+    ids=[
+        "create_zero_parts",
+        "create_empty_name",
+        "update_zero_parts",
+        "update_empty_name",
+    ],
+)
+def test_invalid_input_rejected_before_repository(schema, kwargs):
+    """Test that invalid data fails Pydantic validation, not the database."""
+    with pytest.raises(ValueError):
+        schema(**kwargs)
 
 
 class TestWidgetRepositoryRead:
     """Test widget retrieval operations."""
 
     @pytest.mark.asyncio
-    async def test_get_by_id_success(self, widget_repo):
+    async def test_get_by_id_success(self, widget_repo, sample_widgets):
         """Test successful widget retrieval by ID."""
-        sample_widgets = await create_sample_widgets(widget_repo)
         widget_id = sample_widgets[0].id
 
         widget = await widget_repo.get_by_id(widget_id)
@@ -120,9 +120,10 @@ class TestWidgetRepositoryRead:
         assert "Widget with ID 999 not found" in str(exc_info.value)
 
     @pytest.mark.asyncio
-    async def test_get_all_default_pagination(self, widget_repo):
+    async def test_get_all_default_pagination(
+        self, widget_repo, sample_widgets
+    ):
         """Test getting all widgets with default pagination."""
-        await create_sample_widgets(widget_repo)
         result = await widget_repo.get_all()
 
         assert isinstance(result, PaginationResult)
@@ -133,9 +134,10 @@ class TestWidgetRepositoryRead:
         assert result.pages == 1
 
     @pytest.mark.asyncio
-    async def test_get_all_custom_pagination(self, widget_repo):
+    async def test_get_all_custom_pagination(
+        self, widget_repo, sample_widgets
+    ):
         """Test getting widgets with custom pagination."""
-        await create_sample_widgets(widget_repo)
         result = await widget_repo.get_all(page=2, size=2)
 
         assert len(result.items) == 2
@@ -145,41 +147,38 @@ class TestWidgetRepositoryRead:
         assert result.pages == 3
 
     @pytest.mark.asyncio
-    async def test_get_all_ordering(self, widget_repo):
+    @pytest.mark.parametrize("desc", [False, True], ids=["asc", "desc"])
+    async def test_get_all_ordering(self, widget_repo, sample_widgets, desc):
         """Test getting widgets with custom ordering."""
-        await create_sample_widgets(widget_repo)
-        # Order by name ascending
-        result = await widget_repo.get_all(order_by="name", order_desc=False)
-        names = [widget.name for widget in result.items]
-        assert names == sorted(names)
-
-        # Order by name descending
-        result = await widget_repo.get_all(order_by="name", order_desc=True)
+        result = await widget_repo.get_all(order_by="name", order_desc=desc)
         names = [widget.name for widget in result.items]
-        assert names == sorted(names, reverse=True)
+        assert names == sorted(names, reverse=desc)
 
     @pytest.mark.asyncio
-    async def test_get_all_invalid_pagination_params(self, widget_repo):
+    async def test_get_all_invalid_pagination_params(
+        self, widget_repo, sample_widgets
+    ):
         """Test get_all with invalid pagination parameters."""
-        await create_sample_widgets(widget_repo)
         # Invalid page (should default to 1)
         result = await widget_repo.get_all(page=-1, size=0)
         assert result.page == 1
         assert result.size == 10  # Should default to 10
 
     @pytest.mark.asyncio
-    async def test_get_all_max_page_size_limit(self, widget_repo):
+    async def test_get_all_max_page_size_limit(
+        self, widget_repo, sample_widgets
+    ):
         """Test get_all respects maximum page size limit."""
-        await create_sample_widgets(widget_repo)
         result = await widget_repo.get_all(
             size=200
         )  # Should be limited to 100
         assert result.size == 100
 
     @pytest.mark.asyncio
-    async def test_get_all_invalid_order_field(self, widget_repo):
+    async def test_get_all_invalid_order_field(
+        self, widget_repo, sample_widgets
+    ):
         """Test get_all with invalid order field defaults to 'id'."""
-        await create_sample_widgets(widget_repo)
         result = await widget_repo.get_all(order_by="invalid_field")
         # Should still work and use 'id' as default
         assert len(result.items) == 5
@@ -200,9 +199,8 @@ class TestWidgetRepositoryUpdate:
     """Test widget update operations."""
 
     @pytest.mark.asyncio
-    async def test_update_widget_success(self, widget_repo):
+    async def test_update_widget_success(self, widget_repo, sample_widgets):
         """Test successful widget update."""
-        sample_widgets = await create_sample_widgets(widget_repo)
         widget_id = sample_widgets[0].id
         update_data = WidgetUpdate(name="Updated Widget", number_of_parts=100)
 
@@ -213,9 +211,8 @@ class TestWidgetRepositoryUpdate:
         assert updated_widget.number_of_parts == 100
 
     @pytest.mark.asyncio
-    async def test_update_widget_partial(self, widget_repo):
+    async def test_update_widget_partial(self, widget_repo, sample_widgets):
         """Test partial widget update."""
-        sample_widgets = await create_sample_widgets(widget_repo)
         widget_id = sample_widgets[0].id
         original_name = sample_widgets[0].name
 
@@ -227,9 +224,8 @@ class TestWidgetRepositoryUpdate:
         assert updated_widget.number_of_parts == 99
 
     @pytest.mark.asyncio
-    async def test_update_widget_no_changes(self, widget_repo):
+    async def test_update_widget_no_changes(self, widget_repo, sample_widgets):
         """Test updating widget with no actual changes."""
-        sample_widgets = await create_sample_widgets(widget_repo)
         widget_id = sample_widgets[0].id
         original_widget = sample_widgets[0]
 
@@ -251,21 +247,13 @@ class TestWidgetRepositoryUpdate:
         with pytest.raises(WidgetNotFoundException):
             await widget_repo.update(999, update_data)
 
-    @pytest.mark.asyncio
-    async def test_update_widget_constraint_violation(self, widget_repo):
-        """Test update with constraint violation."""
-        # This should fail at Pydantic validation level
-        with pytest.raises(ValueError):
-            WidgetUpdate(number_of_parts=0)  # Should violate constraint
-
 
 class TestWidgetRepositoryDelete:
     """Test widget deletion operations."""
 
     @pytest.mark.asyncio
-    async def test_delete_widget_success(self, widget_repo):
+    async def test_delete_widget_success(self, widget_repo, sample_widgets):
         """Test successful widget deletion."""
-        sample_widgets = await create_sample_widgets(widget_repo)
         widget_id = sample_widgets[0].id
 
         result = await widget_repo.delete(widget_id)
@@ -273,8 +261,7 @@ class TestWidgetRepositoryDelete:
         assert result is True
 
         # Verify widget is deleted
-        with pytest.raises(WidgetNotFoundException):
-            await widget_repo.get_by_id(widget_id)
+        assert await widget_repo.exists(widget_id) is False
 
     @pytest.mark.asyncio
     async def test_delete_widget_not_found(self, widget_repo):
@@ -287,9 +274,8 @@ class TestWidgetRepositoryUtility:
     """Test utility methods."""
 
     @pytest.mark.asyncio
-    async def test_exists_widget_found(self, widget_repo):
+    async def test_exists_widget_found(self, widget_repo, sample_widgets):
         """Test exists method with existing widget."""
-        sample_widgets = await create_sample_widgets(widget_repo)
         widget_id = sample_widgets[0].id
 
         exists = await widget_repo.exists(widget_id)
@@ -304,9 +290,10 @@ class TestWidgetRepositoryUtility:
         assert exists is False
 
     @pytest.mark.asyncio
-    async def test_get_by_name_pattern_success(self, widget_repo):
+    async def test_get_by_name_pattern_success(
+        self, widget_repo, sample_widgets
+    ):
         """Test searching widgets by name pattern."""
-        await create_sample_widgets(widget_repo)
         # Search for "Widget" pattern
         widgets = await widget_repo.get_by_name_pattern("Widget")
 
@@ -315,9 +302,10 @@ class TestWidgetRepositoryUtility:
             assert "widget" in widget.name.lower()
 
     @pytest.mark.asyncio
-    async def test_get_by_name_pattern_case_insensitive(self, widget_repo):
+    async def test_get_by_name_pattern_case_insensitive(
+        self, widget_repo, sample_widgets
+    ):
         """Test name pattern search is case insensitive."""
-        await create_sample_widgets(widget_repo)
         widgets = await widget_repo.get_by_name_pattern("WIDGET")
 
         assert len(widgets) >= 4
@@ -325,9 +313,10 @@ class TestWidgetRepositoryUtility:
             assert "widget" in widget.name.lower()
 
     @pytest.mark.asyncio
-    async def test_get_by_name_pattern_no_matches(self, widget_repo):
+    async def test_get_by_name_pattern_no_matches(
+        self, widget_repo, sample_widgets
+    ):
         """Test name pattern search with no matches."""
-        await create_sample_widgets(widget_repo)
         widgets = await widget_repo.get_by_name_pattern("NonExistentPattern")
 
         assert len(widgets) == 0
@@ -344,9 +333,10 @@ class TestWidgetRepositoryErrorHandling:
     """Test error handling and edge cases."""
 
     @pytest.mark.asyncio
-    async def test_pagination_result_properties(self, widget_repo):
+    async def test_pagination_result_properties(
+        self, widget_repo, sample_widgets
+    ):
         """Test PaginationResult properties calculation."""
-        await create_sample_widgets(widget_repo)
         result = await widget_repo.get_all(page=2, size=2)
 
         assert result.pages == 3  # 5 total items / 2 per page = 3 pages
@@ -361,15 +351,16 @@ class TestWidgetRepositoryErrorHandling:
         result = await widget_repo.get_all()
         assert result.pages == 0
 
-    @pytest.mark.asyncio
-    async def test_repository_session_handling(self, widget_repo):
+    def test_repository_session_handling(self, widget_repo):
         """Test repository properly handles session."""
         assert widget_repo.session is not None
 
     @pytest.mark.asyncio
-    async def test_concurrent_operations(self, widget_repo):
-        """Test concurrent repository operations."""
-        # Create multiple widgets concurrently
+    async def test_consecutive_creates_on_one_session(self, widget_repo):
+        """Test back-to-back creates on one session get distinct rows."""
+        # An AsyncSession must not be shared by concurrent tasks, and the
+        # in-memory test database lives on a single pooled connection, so
+        # the creates are awaited one after the other
         widget_data1 = WidgetCreate(name="Widget 1", number_of_parts=1)
         widget_data2 = WidgetCreate(name="Widget 2", number_of_parts=2)
 
@@ -391,10 +382,8 @@ class TestWidgetRepositoryIntegration:
         create_data = WidgetCreate(name="CRUD Test Widget", number_of_parts=10)
         created_widget = await widget_repo.create(create_data)
         assert created_widget.id is not None
-
-        # Read
-        retrieved_widget = await widget_repo.get_by_id(created_widget.id)
-        assert retrieved_widget.name == "CRUD Test Widget"
+        # create() returns the row from INSERT ... RETURNING
+        assert created_widget.name == "CRUD Test Widget"
 
         # Update
         update_data = WidgetUpdate(
@@ -411,16 +400,13 @@ class TestWidgetRepositoryIntegration:
         assert delete_result is True
 
         # Verify deletion
-        with pytest.raises(WidgetNotFoundException):
-            await widget_repo.get_by_id(created_widget.id)
+        assert await widget_repo.exists(created_widget.id) is False
 
     @pytest.mark.asyncio
     async def test_repository_with_database_constraints(self, widget_repo):
         """Test repository operations respect database constraints."""
         # Test name length constraint through repository
-        create_data = WidgetCreate(
-            name="a" * 64, number_of_parts=5
-        )  # Max length
+        create_data = WidgetCreate(name=_MAX_NAME_64, number_of_parts=5)
         widget = await widget_repo.create(create_data)
         assert len(widget.name) == 64
 
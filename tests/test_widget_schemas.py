@@ -6,11 +6,11 @@ and error handling.
 """
 
 from datetime import datetime
+from types import MappingProxyType, SimpleNamespace
 
 import pytest
 from pydantic import ValidationError
 
-from src.app.models.widget import Widget
 from src.app.schemas.widget import (
     WidgetBase,
     WidgetCreate,
@@ -19,6 +19,39 @@ from src.app.schemas.widget import (
     WidgetUpdate,
 )
 
+_MAX_NAME_64 = "a" * 64
+_LONG_NAME_65 = "a" * 65
+_BASE_SCHEMA = WidgetBase.model_json_schema()
+_RESP_SCHEMA = WidgetResponse.model_json_schema()
+_FIXED_NOW = datetime(2024, 1, 1, 12, 0, 0)
+_EXPECTED_ISO = _FIXED_NOW.isoformat()
+_RESP_KWARGS = MappingProxyType(
+    dict(
+        id=1,
+        name="Response Widget",
+        number_of_parts=8,
+        created_at=_FIXED_NOW,
+        updated_at=_FIXED_NOW,
+    )
+)
+# Trusted list items; the list schema is what the list tests exercise
+_WIDGETS = [
+    WidgetResponse.model_construct(
+        id=i,
+        name=f"Widget {i}",
+        number_of_parts=i * 5,
+        created_at=_FIXED_NOW,
+        updated_at=_FIXED_NOW,
+    )
+    for i in (1, 2)
+]
+
+
+@pytest.fixture(scope="module")
+def sample_widget_response():
+    """Build a trusted WidgetResponse once for serialization tests."""
+    return WidgetResponse.model_construct(**_RESP_KWARGS)
+
 
 class TestWidgetBase:
     """Test the WidgetBase schema."""
@@ -33,29 +66,36 @@ class TestWidgetBase:
     def test_name_validation_max_length(self):
         """Test name validation with maximum length."""
         # 64 characters should be valid
-        valid_name = "a" * 64
+        valid_name = _MAX_NAME_64
         widget = WidgetBase(name=valid_name, number_of_parts=1)
         assert widget.name == valid_name
 
-        # 65 characters should fail
-        invalid_name = "a" * 65
-        with pytest.raises(ValidationError) as exc_info:
-            WidgetBase(name=invalid_name, number_of_parts=1)
-        assert "String should have at most 64 characters" in str(
-            exc_info.value
-        )
-
-    def test_name_validation_empty(self):
-        """Test name validation with empty values."""
-        # Empty string should fail
-        with pytest.raises(ValidationError) as exc_info:
-            WidgetBase(name="", number_of_parts=1)
-        assert "String should have at least 1 character" in str(exc_info.value)
-
-        # Whitespace only should fail
-        with pytest.raises(ValidationError) as exc_info:
-            WidgetBase(name="   ", number_of_parts=1)
-        assert "Name cannot be empty or whitespace only" in str(exc_info.value)
+    @pytest.mark.parametrize(
+        "field, value, msg",
+        [
+            ("number_of_parts", 0, "Input should be greater than 0"),
+            ("number_of_parts", -1, "Input should be greater than 0"),
+            ("name", "", "String should have at least 1 character"),
+            ("name", "   ", "Name cannot be empty or whitespace only"),
+            (
+                "name",
+                _LONG_NAME_65,
+                "String should have at most 64 characters",
+            ),
+        ],
+        ids=[
+            "zero_parts",
+            "negative_parts",
+            "empty_name",
+            "whitespace_name",
+            "name_too_long",
+        ],
+    )
+    def test_invalid_field_rejected(self, field, value, msg):
+        """Test that invalid field values fail validation."""
+        data = {"name": "Test", "number_of_parts": 1, field: value}
+        with pytest.raises(ValidationError, match=msg):
+            WidgetBase(**data)
 
     def test_name_validation_whitespace_trim(self):
         """Test name validation trims whitespace."""
@@ -71,29 +111,15 @@ class TestWidgetBase:
         widget = WidgetBase(name="Test", number_of_parts=100)
         assert widget.number_of_parts == 100
 
-    def test_number_of_parts_validation_invalid(self):
-        """Test number_of_parts validation with invalid values."""
-        # Zero should fail
-        with pytest.raises(ValidationError) as exc_info:
-            WidgetBase(name="Test", number_of_parts=0)
-        assert "Input should be greater than 0" in str(exc_info.value)
-
-        # Negative should fail
-        with pytest.raises(ValidationError) as exc_info:
-            WidgetBase(name="Test", number_of_parts=-1)
-        assert "Input should be greater than 0" in str(exc_info.value)
-
     def test_required_fields(self):
         """Test that required fields are enforced."""
         # Missing name
-        with pytest.raises(ValidationError) as exc_info:
+        with pytest.raises(ValidationError, match="Field required"):
             WidgetBase(number_of_parts=1)
-        assert "Field required" in str(exc_info.value)
 
         # Missing number_of_parts
-        with pytest.raises(ValidationError) as exc_info:
+        with pytest.raises(ValidationError, match="Field required"):
             WidgetBase(name="Test")
-        assert "Field required" in str(exc_info.value)
 
 
 class TestWidgetCreate:
@@ -150,32 +176,30 @@ class TestWidgetUpdate:
         widget = WidgetUpdate(name="Valid Name")
         assert widget.name == "Valid Name"
 
-        # Invalid name should fail
-        with pytest.raises(ValidationError) as exc_info:
-            WidgetUpdate(name="")
-        assert "String should have at least 1 character" in str(exc_info.value)
-
-        # Long name should fail
-        with pytest.raises(ValidationError) as exc_info:
-            WidgetUpdate(name="a" * 65)
-        assert "String should have at most 64 characters" in str(
-            exc_info.value
-        )
-
     def test_number_of_parts_validation_when_provided(self):
         """Test number_of_parts validation when provided in update."""
         # Valid number should work
         widget = WidgetUpdate(number_of_parts=5)
         assert widget.number_of_parts == 5
 
-        # Invalid number should fail
-        with pytest.raises(ValidationError) as exc_info:
-            WidgetUpdate(number_of_parts=0)
-        assert "Input should be greater than 0" in str(exc_info.value)
-
-        with pytest.raises(ValidationError) as exc_info:
-            WidgetUpdate(number_of_parts=-1)
-        assert "Input should be greater than 0" in str(exc_info.value)
+    @pytest.mark.parametrize(
+        "field, value, msg",
+        [
+            ("number_of_parts", 0, "Input should be greater than 0"),
+            ("number_of_parts", -1, "Input should be greater than 0"),
+            ("name", "", "String should have at least 1 character"),
+            (
+                "name",
+                _LONG_NAME_65,
+                "String should have at most 64 characters",
+            ),
+        ],
+        ids=["zero_parts", "negative_parts", "empty_name", "name_too_long"],
+    )
+    def test_invalid_field_rejected(self, field, value, msg):
+        """Test that invalid values fail validation when provided."""
+        with pytest.raises(ValidationError, match=msg):
+            WidgetUpdate(**{field: value})
 
     def test_whitespace_trimming_in_update(self):
         """Test whitespace trimming in update schema."""
@@ -188,51 +212,30 @@ class TestWidgetResponse:
 
     def test_valid_widget_response(self):
         """Test creating a valid WidgetResponse."""
-        now = datetime.now()
-        data = {
-            "id": 1,
-            "name": "Response Widget",
-            "number_of_parts": 8,
-            "created_at": now,
-            "updated_at": now,
-        }
-        widget = WidgetResponse(**data)
+        widget = WidgetResponse(**_RESP_KWARGS)
         assert widget.id == 1
         assert widget.name == "Response Widget"
         assert widget.number_of_parts == 8
-        assert widget.created_at == now
-        assert widget.updated_at == now
+        assert widget.created_at == _FIXED_NOW
+        assert widget.updated_at == _FIXED_NOW
 
     def test_from_orm_model(self):
-        """Test creating WidgetResponse from ORM model."""
-        # Create a mock Widget model (without saving to DB)
-        now = datetime.now()
-        widget_orm = Widget(
-            id=1,
-            name="ORM Widget",
-            number_of_parts=12,
-            created_at=now,
-            updated_at=now,
-        )
+        """Test creating WidgetResponse from ORM-style attributes."""
+        # from_attributes reads plain attributes, so a namespace stands in
+        # for a Widget without SQLAlchemy's instrumentation overhead
+        widget_orm = SimpleNamespace(**_RESP_KWARGS)
 
         # Convert to Pydantic model
         widget_response = WidgetResponse.model_validate(widget_orm)
         assert widget_response.id == 1
-        assert widget_response.name == "ORM Widget"
-        assert widget_response.number_of_parts == 12
-        assert widget_response.created_at == now
-        assert widget_response.updated_at == now
+        assert widget_response.name == "Response Widget"
+        assert widget_response.number_of_parts == 8
+        assert widget_response.created_at == _FIXED_NOW
+        assert widget_response.updated_at == _FIXED_NOW
 
-    def test_datetime_serialization(self):
+    def test_datetime_serialization(self, sample_widget_response):
         """Test datetime serialization format."""
-        now = datetime.now()
-        widget = WidgetResponse(
-            id=1,
-            name="DateTime Test",
-            number_of_parts=5,
-            created_at=now,
-            updated_at=now,
-        )
+        widget = sample_widget_response
 
         # Convert to dict and check datetime format
         widget_dict = widget.model_dump()
@@ -241,7 +244,7 @@ class TestWidgetResponse:
 
         # Convert to JSON and check ISO format
         widget_json = widget.model_dump_json()
-        assert now.isoformat() in widget_json
+        assert _EXPECTED_ISO in widget_json
 
 
 class TestWidgetListResponse:
@@ -249,26 +252,8 @@ class TestWidgetListResponse:
 
     def test_valid_widget_list_response(self):
         """Test creating a valid WidgetListResponse."""
-        now = datetime.now()
-        widgets = [
-            WidgetResponse(
-                id=1,
-                name="Widget 1",
-                number_of_parts=5,
-                created_at=now,
-                updated_at=now,
-            ),
-            WidgetResponse(
-                id=2,
-                name="Widget 2",
-                number_of_parts=10,
-                created_at=now,
-                updated_at=now,
-            ),
-        ]
-
         list_response = WidgetListResponse(
-            widgets=widgets, total=2, page=1, size=10, pages=1
+            widgets=_WIDGETS, total=2, page=1, size=10, pages=1
         )
 
         assert len(list_response.widgets) == 2
@@ -277,59 +262,43 @@ class TestWidgetListResponse:
         assert list_response.size == 10
         assert list_response.pages == 1
 
-    def test_empty_widget_list_response(self):
-        """Test empty widget list response."""
-        list_response = WidgetListResponse(
-            widgets=[], total=0, page=1, size=10, pages=0
-        )
-
-        assert len(list_response.widgets) == 0
-        assert list_response.total == 0
-        assert list_response.page == 1
-        assert list_response.size == 10
-        assert list_response.pages == 0
-
     def test_pagination_fields(self):
         """Test pagination field validation."""
         # All fields are required
         with pytest.raises(ValidationError):
             WidgetListResponse(widgets=[])  # Missing required fields
 
+        # An empty page with all fields present is valid
+        list_response = WidgetListResponse(
+            widgets=[], total=0, page=1, size=10, pages=0
+        )
+        assert list_response.widgets == []
+
 
 class TestSchemaIntegration:
     """Test schema integration and edge cases."""
 
-    def test_json_serialization_full_cycle(self):
+    def test_json_serialization_full_cycle(self, sample_widget_response):
         """Test full JSON serialization/deserialization cycle."""
-        now = datetime.now()
-
-        # Create response
-        widget_response = WidgetResponse(
-            id=1,
-            name="JSON Test",
-            number_of_parts=7,
-            created_at=now,
-            updated_at=now,
-        )
-
         # Serialize to JSON
-        json_str = widget_response.model_dump_json()
+        json_str = sample_widget_response.model_dump_json()
 
         # Parse back from JSON
-        data = widget_response.model_validate_json(json_str)
+        data = WidgetResponse.model_validate_json(json_str)
         assert data.id == 1
-        assert data.name == "JSON Test"
-        assert data.number_of_parts == 7
+        assert data.name == "Response Widget"
+        assert data.number_of_parts == 8
+        assert data.created_at == sample_widget_response.created_at
 
     def test_field_descriptions_present(self):
         """Test that field descriptions are present for API documentation."""
         # Check WidgetBase fields have descriptions
-        schema = WidgetBase.model_json_schema()
-        assert "description" in schema["properties"]["name"]
-        assert "description" in schema["properties"]["number_of_parts"]
+        properties = _BASE_SCHEMA["properties"]
+        assert "description" in properties["name"]
+        assert "description" in properties["number_of_parts"]
 
         # Check WidgetResponse fields have descriptions
-        schema = WidgetResponse.model_json_schema()
-        assert "description" in schema["properties"]["id"]
-        assert "description" in schema["properties"]["created_at"]
-        assert "description" in schema["properties"]["updated_at"]
+        properties = _RESP_SCHEMA["properties"]
+        assert "description" in properties["id"]
+        assert "description" in properties["created_at"]
+        assert "description" in properties["updated_at"]